@@ -1,10 +1,133 @@
-import simplejson
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import copy
 import csv
+import functools
+import hashlib
+import io
+import itertools
+import mmap
+import operator
+import json
 import os
+import re
+import stat
 import sys
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the standard library json module is used instead.
+    orjson = None
+
+# A run of 20 digits may be an integer wider than 64 bits, which orjson would
+# silently load as a float. Such documents are decoded with json instead.
+_WIDE_INT_PATTERN = re.compile(rb'\d{20}')
+
+
+def _json_loads(raw):
+    """Decodes UTF-8 JSON bytes, with orjson when it is lossless."""
+
+    if orjson is not None and _WIDE_INT_PATTERN.search(raw) is None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN and Infinity, which json accepts. Genuinely
+            # invalid data is reported by json below.
+            pass
+
+    # json.loads does not accept memoryviews of mapped files.
+    return json.loads(bytes(raw))
+
+
+def _has_non_finite_float(data):
+    """Checks whether a decoded JSON document contains NaN or Infinity."""
+
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is dict:
+            stack.extend(value.values())
+        elif value_type is list:
+            stack.extend(value)
+        elif value_type is float and value - value != 0:
+            return True
+    return False
+
+
+def _json_dumps(data):
+    """Encodes data to UTF-8 JSON bytes, with orjson when it is lossless."""
+
+    # orjson writes NaN and Infinity as null, and raises for integers wider
+    # than 64 bits, so json handles those documents.
+    if orjson is not None and not _has_non_finite_float(data):
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            pass
+
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+try:
+    import simdjson
+except ImportError:
+    # Without pysimdjson, memory-mapped JSON files are parsed with _json_loads.
+    simdjson = None
+
+try:
+    import ijson
+except ImportError:
+    # Without ijson, JSON to CSV conversions load the whole file in memory.
+    ijson = None
+
+# ijson silently falls back to a pure Python parser, which is an order of
+# magnitude slower than loading the file, so only stream with a C backend.
+_IJSON_STREAMING = (
+    ijson is not None and ijson.backend in ('yajl2_c', 'yajl2_cffi')
+)
+
+# UTF-8 byte order mark, common in files saved on Windows. orjson rejects it,
+# so it is skipped before decoding.
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+# JSON files of at least this size are memory-mapped rather than read.
+MMAP_MIN_SIZE = 1 << 22
+
+# JSON arrays of at least this size are streamed to CSV rather than loaded.
+# Below it, loading the whole file is faster and its memory use is modest.
+STREAM_MIN_SIZE = 1 << 26
+
+# Size of the sample read from a CSV to sniff its dialect.
+SNIFF_SAMPLE_SIZE = 4096
+
+# Sniffed CSV dialects, keyed by a hash of the sample they were sniffed from,
+# so that batches of files with the same layout are only sniffed once.
+_DIALECT_CACHE = {}
+_DIALECT_CACHE_MAX_SIZE = 1024
+
+# Dialect used instead of sniffing when no delimiter is given, see
+# set_default_dialect.
+_default_dialect = None
+
+# Strings longer than this are trimmed when trim_long_strings is True.
+EXCEL_CELL_CHAR_LIMIT = 32750
+
+# Buffer size of CSV files being written.
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Number of rows handed to the CSV writer at a time when streaming.
+STREAM_CHUNK_SIZE = 10000
+
+# String values converted to Booleans when importing a CSV. Covers the common
+# casings, which avoids calling str.lower() on every cell.
+# See str2bool_or_none.
+_BOOL_MAP = {
+    'true': True, 'True': True, 'TRUE': True,
+    'false': False, 'False': False, 'FALSE': False,
+}
+
 # TODO: Use logger object instead of printing output to console.
 
 # TODO: Better handling of deeply-nested JSON files.
@@ -31,11 +154,37 @@ def str2bool(str) -> bool:
         return False
 
 
-def import_data_from_disk(filepath, headers=None):
+def str2bool_or_none(value):
+    """Converts a "true" or "false" string of any casing to bool.
+
+        Common casings are resolved with a single dict lookup. Only strings
+        that start with 't' or 'f' (of any case) and miss that lookup are
+        lowercased, so most values are rejected without allocating a new
+        string.
+
+        Parameters
+        ----------
+        value : str
+            String to convert.
+
+        Returns
+        -------
+        bool or None
+            The Boolean value, or None if value is not "true" or "false"."""
+
+    b = _BOOL_MAP.get(value)
+    if b is None and value and value[0] in 'tTfF':
+        b = _BOOL_MAP.get(value.lower())
+    return b
+
+
+def import_data_from_disk(filepath, headers=None, delimiter=None,
+                          file_stat=None):
     """Routes import task to appropriate function depending on file type.
 
         Currently, only JSON and CSV are supported.
-        The 'headers' parameter is only pertinent to importing CSVs.
+        The 'headers' and 'delimiter' parameters are only pertinent to
+        importing CSVs.
         If the file is not found, or has an extension other than '.csv',
         or '.json', prints an error message and returns None.
 
@@ -46,6 +195,12 @@ def import_data_from_disk(filepath, headers=None):
         headers : list, optional
             List containing the fieldnames (column names) for a CSV, by default
             None
+        delimiter : str, optional
+            Delimiter of the CSV. If None, it is detected from the file, by
+            default None
+        file_stat : os.stat_result, optional
+            Result of os.stat on filepath, if the caller already has it, by
+            default None
 
         Returns
         -------
@@ -54,27 +209,39 @@ def import_data_from_disk(filepath, headers=None):
             returns a list."""
 
     data = None
-    extension = Path(filepath).suffix.casefold()
-
-    if Path(filepath).exists():
-        if extension=='.json':
-            data = import_json_from_disk(filepath)
-        elif extension=='.csv':
-            data = import_csv_from_disk(filepath, headers)
-        else:
+    filepath = Path(filepath)
+    extension = filepath.suffix.lower()
+
+    # A single stat call covers existence, file type and emptiness.
+    if file_stat is None:
+        try:
+            file_stat = os.stat(filepath)
+        except (FileNotFoundError, NotADirectoryError):
             print(
-                "Data can only be imported from .json and .csv formats."
+                f"Path {filepath} could not be found."
             )
+            return data
 
+    if not stat.S_ISREG(file_stat.st_mode):
+        print(
+            f"Path {filepath} is not a file."
+        )
+    elif file_stat.st_size==0:
+        print(
+            f'{filepath} is empty.'
+        )
+    elif extension in _IMPORTERS:
+        data = _IMPORTERS[extension](filepath, headers, delimiter,
+                                     file_stat.st_size)
     else:
         print(
-            f"Path {filepath} could not be found."
+            "Data can only be imported from .json and .csv formats."
         )
 
     return data
 
 
-def import_json_from_disk(filepath):
+def import_json_from_disk(filepath, size=None):
     """Decodes a JSON file into a Python iterable.
 
         Opens a JSON file, parses it, and returns a Python iterable (dict or
@@ -85,6 +252,8 @@ def import_json_from_disk(filepath):
         ----------
         filepath : Path
             Full path to JSON file.
+        size : int, optional
+            Size of the file in bytes, if already known, by default None
 
         Returns
         -------
@@ -93,23 +262,72 @@ def import_json_from_disk(filepath):
 
     data=None
 
-    with open(filepath, 'r', encoding='utf-8', errors='strict') as f:
-        if os.stat(filepath).st_size==0:
+    with open(filepath, 'rb') as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size==0:
             print(
                 f'{filepath} is empty.'
             )
-        else:
-            try:
-                data = simplejson.load(f)
-            except:
-                print(
-                    f'{filepath} contains invalid JSON data.'
-                )
+            return data
+
+        try:
+            if size >= MMAP_MIN_SIZE:
+                # Large files are parsed straight from the page cache instead
+                # of being copied into a bytes object first.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = load_json_from_buffer(mm)
+            else:
+                raw = f.read()
+                if raw[:3]==_UTF8_BOM:
+                    raw = raw[3:]
+                data = _json_loads(raw)
+        # Invalid data raises a ValueError subclass with every decoder.
+        except ValueError as e:
+            print(
+                f'{filepath} contains invalid JSON data: {e}'
+            )
 
     return data
 
 
-def import_csv_from_disk(filepath, headers=None):
+def load_json_from_buffer(buffer):
+    """Decodes JSON from a buffer, such as a memory-mapped file.
+
+        Uses pysimdjson if it is installed, else the default JSON decoder.
+        pysimdjson rejects integers wider than 64 bits, NaN and Infinity, so
+        documents it fails on are handed to the default decoder, which also
+        reports genuinely invalid data.
+
+        Parameters
+        ----------
+        buffer : mmap.mmap or bytes
+            UTF-8 encoded JSON document.
+
+        Returns
+        -------
+        list or dict or str or int or float or bool or None
+            The decoded document, made of plain Python objects."""
+
+    if simdjson is not None:
+        try:
+            # recursive=True returns plain dicts and lists instead of lazy
+            # proxies.
+            return simdjson.Parser().parse(buffer, True)
+        # RuntimeError is raised for BIGINT_ERROR, ValueError for NaN and
+        # invalid data.
+        except (RuntimeError, ValueError):
+            pass
+
+    # Both views are released explicitly, even if decoding fails, since a
+    # mapped file cannot be closed while a view of it is alive.
+    offset = 3 if buffer[:3]==_UTF8_BOM else 0
+    with memoryview(buffer) as view, view[offset:] as body:
+        return _json_loads(body)
+
+
+def import_csv_from_disk(filepath, headers=None, delimiter=None, size=None,
+                        coerce_bools=True):
     """Loads rows from a CSV file into a Python iterable.
 
         Loads rows from a  CSV file into a Python iterable.
@@ -127,12 +345,23 @@ def import_csv_from_disk(filepath, headers=None):
         If a non-blank row has fewer fields than headers, the missing values
         are filled-in with 'None'.
 
+        If 'delimiter' is 'None', the dialect of the file is detected (see
+        make_csv_reader).
+
         Parameters
         ----------
         filepath : Path
             Full path to CSV file.
         headers : list or tuple, optional
             headers to use as dictionary keys for each record, by default None
+        delimiter : str, optional
+            Delimiter of the CSV, by default None
+        size : int, optional
+            Size of the file in bytes, if already known, by default None
+        coerce_bools : bool, optional
+            If True, String true and false values are converted to Booleans,
+            which only matters if the data is then exported to JSON, by
+            default True
 
         Returns
         -------
@@ -144,38 +373,205 @@ def import_csv_from_disk(filepath, headers=None):
 
     with open(filepath, 'r', encoding='utf-8', errors='strict',
               newline='') as f:
-        if os.stat(filepath).st_size==0:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size==0:
             print(
                 f'{filepath} is empty.'
             )
         else:
             try:
-                # Mostly useful for determining the delimiter used.
-                dialect = csv.Sniffer().sniff(f.read(4096))
-                f.seek(0)
-
-                reader = csv.DictReader(
-                    f, fieldnames=headers, dialect=dialect
-                )
+                reader = make_csv_reader(f, headers, delimiter)
                 data =list(reader)
-            except:
+            except (csv.Error, UnicodeDecodeError) as e:
                 print(
-                    f'{filepath} exists, but could not load it.'
+                    f'{filepath} exists, but could not load it: {e}'
                 )
 
-    # Convert String true and false values to Boolean.
-    if data is not None:
+    if data is not None and coerce_bools:
         for record in data:
-            for k,v in record.items():
-                if not isinstance(v, list) and v.lower() in ['true', 'false']:
-                    record[k] = str2bool(v)
+            coerce_record_bools(record)
 
-    if len(data)==1:
+    if data is not None and len(data)==1:
         data = data[0]
 
     return data
 
 
+# Import functions by file extension, all called with
+# (filepath, headers, delimiter, size).
+_IMPORTERS = {
+    '.json': lambda filepath, headers, delimiter, size:
+        import_json_from_disk(filepath, size),
+    '.csv': import_csv_from_disk,
+}
+
+
+def iter_csv_from_disk(filepath, headers=None, delimiter=None,
+                       coerce_bools=True):
+    """Yields the rows of a CSV file one at a time.
+
+        The streaming counterpart of import_csv_from_disk: the same 'headers'
+        and 'delimiter' rules apply and String true and false values are
+        converted to Booleans (unless 'coerce_bools' is False), but rows are
+        read lazily so that only one is held in memory at a time. If the file
+        is empty, a message is printed and nothing is yielded. Errors while
+        reading (csv.Error, UnicodeDecodeError) are raised to the consumer, so
+        that it can discard what it has written so far.
+
+        Parameters
+        ----------
+        filepath : Path
+            Full path to CSV file.
+        headers : list or tuple, optional
+            headers to use as dictionary keys for each record, by default None
+        delimiter : str, optional
+            Delimiter of the CSV, by default None
+        coerce_bools : bool, optional
+            If True, String true and false values are converted to Booleans,
+            by default True
+
+        Yields
+        ------
+        dict
+            A single row of the CSV file."""
+
+    with open(filepath, 'r', encoding='utf-8', errors='strict',
+              newline='') as f:
+        if os.fstat(f.fileno()).st_size==0:
+            print(
+                f'{filepath} is empty.'
+            )
+            return
+
+        reader = make_csv_reader(f, headers, delimiter)
+        if not coerce_bools:
+            yield from reader
+            return
+        for record in reader:
+            coerce_record_bools(record)
+            yield record
+
+
+def set_default_dialect(delimiter, quotechar='"', escapechar=None):
+    """Sets the dialect of CSVs imported without an explicit delimiter.
+
+        Once set, csv.Sniffer is not used at all, which is useful when a batch
+        of files is known to share the same format. Call with delimiter=None to
+        go back to sniffing. The setting is per process, so with
+        convert_files it only reaches workers that are forked, not spawned.
+
+        Parameters
+        ----------
+        delimiter : str or None
+            Delimiter of the CSVs.
+        quotechar : str, optional
+            Char used to quote fields with special chars, by default '"'
+        escapechar : str, optional
+            Char used to escape the delimiter when not quoting, by default
+            None"""
+
+    global _default_dialect
+
+    if delimiter is None:
+        _default_dialect = None
+    else:
+        _default_dialect = type('DefaultDialect', (csv.excel,), {
+            'delimiter': delimiter,
+            'quotechar': quotechar,
+            'escapechar': escapechar,
+        })
+
+
+def sniff_dialect(sample):
+    """Detects the dialect of a CSV sample, reusing earlier results.
+
+        Results of csv.Sniffer are cached by a hash of the sample, so files
+        starting with the same SNIFF_SAMPLE_SIZE characters are only sniffed
+        once.
+
+        Parameters
+        ----------
+        sample : str
+            First characters of the CSV file.
+
+        Returns
+        -------
+        csv.Dialect
+            The detected dialect."""
+
+    key = hashlib.blake2b(
+        sample.encode('utf-8', 'surrogatepass'), digest_size=8
+    ).digest()
+    dialect = _DIALECT_CACHE.get(key)
+    if dialect is None:
+        dialect = csv.Sniffer().sniff(sample)
+        if len(_DIALECT_CACHE) >= _DIALECT_CACHE_MAX_SIZE:
+            _DIALECT_CACHE.clear()
+        _DIALECT_CACHE[key] = dialect
+
+    return dialect
+
+
+def make_csv_reader(f, headers=None, delimiter=None):
+    """Creates a csv.DictReader for an open CSV file.
+
+        If 'delimiter' is 'None', the dialect set with set_default_dialect is
+        used or, if there is none, the dialect of the file is detected from its
+        first SNIFF_SAMPLE_SIZE characters (see sniff_dialect). Otherwise,
+        sniffing is skipped and the default (excel) dialect is used with the
+        given delimiter.
+
+        Parameters
+        ----------
+        f : file object
+            CSV file opened in text mode with newline=''.
+        headers : list or tuple, optional
+            headers to use as dictionary keys for each record, by default None
+        delimiter : str, optional
+            Delimiter of the CSV, by default None
+
+        Returns
+        -------
+        csv.DictReader
+            Reader yielding a dict per row."""
+
+    if delimiter is not None:
+        return csv.DictReader(f, fieldnames=headers, delimiter=delimiter)
+    if _default_dialect is not None:
+        return csv.DictReader(f, fieldnames=headers, dialect=_default_dialect)
+
+    # Mostly useful for determining the delimiter used.
+    sample = f.read(SNIFF_SAMPLE_SIZE)
+    dialect = sniff_dialect(sample)
+    if len(sample) < SNIFF_SAMPLE_SIZE:
+        # The sample is the whole file, no need to read it again.
+        f = io.StringIO(sample, newline='')
+    else:
+        f.seek(0)
+
+    return csv.DictReader(f, fieldnames=headers, dialect=dialect)
+
+
+def coerce_record_bools(record):
+    """Converts String true and false values of a CSV row to Boolean.
+
+        The record is modified in place. Values that are not strings (lists of
+        extra fields, or None for missing fields) are skipped, as are strings
+        of any length other than 4 or 5.
+
+        Parameters
+        ----------
+        record : dict
+            A single row of a CSV file."""
+
+    for k,v in record.items():
+        if type(v) is str and len(v) in (4, 5):
+            b = str2bool_or_none(v)
+            if b is not None:
+                record[k] = b
+
+
 def export_data_to_disk(filepath, data, delimiter=',', headers=None,
                         headers_auto_method='1st_item',
                         trim_long_strings=False):
@@ -203,13 +599,12 @@ def export_data_to_disk(filepath, data, delimiter=',', headers=None,
             Trim strings that exceed Excel cell char limit. Only pertinent for
             CSV exports, by default False"""
 
-    extension = Path(filepath).suffix.casefold()
+    filepath = Path(filepath)
+    extension = filepath.suffix.lower()
 
-    if extension=='.json':
-        export_json_data_to_disk(filepath, data)
-    elif extension=='.csv':
-        export_csv_data_to_disk(filepath, data, delimiter, headers,
-                                headers_auto_method, trim_long_strings)
+    if extension in _EXPORTERS:
+        _EXPORTERS[extension](filepath, data, delimiter, headers,
+                              headers_auto_method, trim_long_strings)
     else:
         sys.exit(
                 "Exports can only be made to .json and .csv formats."
@@ -228,16 +623,9 @@ def export_json_data_to_disk(filepath, data):
         data : list or dict
             list or dict that will be converted to JSON."""
 
-    # ensure_ascii=false works together with the encoding of 'utf-8' in the
-    # open keyword. If problems happen with unicode characters, play around
-    # with these parameters.
+    # The encoder returns UTF-8 bytes (non-ASCII characters are written as-is,
+    # not escaped), so the file is opened in binary mode.
     # See this also: https://bit.ly/3qkbRwe
-    # Errors in open is an optional string that specifies how encoding and
-    # decoding errors are to be handled—this cannot be used in binary mode. I
-    # have currently set it to 'strict' to raise ValueError exceptions
-    # whenever there is an encoding error, so I can spot problems. Another
-    # option is 'replace', which will cause a replacement marker (such as '?')
-    # to be inserted where there is malformed data.
 
     if data is None:
         print(
@@ -245,12 +633,12 @@ def export_json_data_to_disk(filepath, data):
         )
 
     else:
-        dir = Path(filepath).parents[0]
-        if not dir.exists():
-            Path(dir).mkdir(parents=True, exist_ok=False)
+        parent = filepath.parent
+        if not parent.is_dir():
+            parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, 'w', encoding='utf-8', errors='strict') as f:
-            simplejson.dump(data, f, ensure_ascii=False, indent=4 * ' ')
+        with open(filepath, 'wb') as f:
+            f.write(_json_dumps(data))
 
 
 def enforce_excel_cell_string_limit(long_string, limit):
@@ -271,6 +659,88 @@ def enforce_excel_cell_string_limit(long_string, limit):
         return long_string
 
 
+def make_row_getter(headers):
+    """Builds a function that returns the values of a dict in headers order.
+
+        The values are fetched with a single operator.itemgetter call. Keys
+        not in headers are ignored and headers missing from the dict are
+        filled-in with an empty string, like csv.DictWriter does with
+        restval='' and extrasaction='ignore'.
+
+        Parameters
+        ----------
+        headers : list
+            The fieldnames (column names) of the CSV.
+
+        Returns
+        -------
+        function
+            Function taking a dict and returning a tuple of its values."""
+
+    headers = list(headers)
+    if not headers:
+        return lambda item: ()
+
+    getter = operator.itemgetter(*headers)
+    # itemgetter returns a bare value, rather than a tuple, for a single key.
+    single = len(headers)==1
+
+    def get_row(item):
+        try:
+            row = getter(item)
+        except KeyError:
+            return tuple(item.get(h, '') for h in headers)
+        return (row,) if single else row
+
+    return get_row
+
+
+def make_row_function(headers, trim_long_strings=False):
+    """Builds a function that turns a dict into a CSV row.
+
+        Without trimming, this is the function from make_row_getter. With
+        trimming, the source of a function specialized to the given headers
+        is generated and compiled: it has one unrolled expression per column
+        that fetches the value and trims it to EXCEL_CELL_CHAR_LIMIT, so no
+        loop or function call runs per cell.
+
+        Parameters
+        ----------
+        headers : list
+            The fieldnames (column names) of the CSV.
+        trim_long_strings : bool, optional
+            If True, the values are converted to strings and trimmed to the
+            Excel cell char limit, by default False
+
+        Returns
+        -------
+        function
+            Function taking a dict and returning a sequence of its values."""
+
+    if not trim_long_strings:
+        return make_row_getter(headers)
+
+    # Header names are passed in the namespace, not written in the source, so
+    # any hashable key works.
+    namespace = {f'_h{i}': h for i, h in enumerate(headers)}
+    limit = EXCEL_CELL_CHAR_LIMIT
+    columns = ''.join(
+        f"        (s if len(s := str(get(_h{i}, ''))) <= {limit} "
+        f"else s[:{limit - 3}] + '...'),\n"
+        for i in range(len(namespace))
+    )
+    source = (
+        'def row_function(item):\n'
+        '    get = item.get\n'
+        '    return (\n'
+        f'{columns}'
+        '    )\n'
+    )
+    exec(source, namespace)
+
+    return namespace['row_function']
+
+
 def export_csv_data_to_disk(filepath, data, delimiter=',',
     headers=None, headers_auto_method='1st_item', trim_long_strings=None,):
     """Exports a collection of dictionaries, or a single dictionary to a CSV
@@ -304,9 +774,8 @@ def export_csv_data_to_disk(filepath, data, delimiter=',',
         will be exported.
 
         Another thing this function does is to trim very long strings that would
-        not fit in a CSV cell. Such behaviour mutates the passed dictionary, so
-        we need to use copy.deepcopy() on it first, before editing it and saving
-        it to disk.
+        not fit in a CSV cell. Trimmed values are written from a new dict built
+        for each row, so the passed data is never mutated.
 
         Parameters
         ----------
@@ -334,35 +803,37 @@ def export_csv_data_to_disk(filepath, data, delimiter=',',
         )
         return
 
-    to_export_data = copy.deepcopy(data)
+    to_export_data = data
+    # Rows already laid out in headers order, if the reshape produces them.
+    rows = None
 
-    dir = Path(filepath).parents[0]
-    if not dir.exists():
-        Path(dir).mkdir(parents=True, exist_ok=False)
+    parent = filepath.parent
+    if not parent.is_dir():
+        parent.mkdir(parents=True, exist_ok=True)
 
     if isinstance(to_export_data, dict):
         if headers is None:
+            first_v = next(iter(to_export_data.values()))
             # If we have a nested dictionary:
-            if isinstance(list(to_export_data.values())[0], dict):
-                for k,v in to_export_data.items():
-                    # Use keys in first nested dict to create the headers.
-                    headers = list(v.keys())
-                    # then turn the dict to a collection
-                    to_export_data = list(to_export_data.values())
-                    break
+            if isinstance(first_v, dict):
+                # Use keys in first nested dict to create the headers.
+                headers = list(first_v.keys())
+                # then turn the dict to a collection
+                to_export_data = list(to_export_data.values())
             else:
                 # Single dictionary item. Code below produces vertical table.
-                count = 0
-                temp_data = []
-                for k,v in to_export_data.items():
-                    if count==0:
-                        # Use first [key, val] pair as headers.
-                        headers = [k, v]
-                        count += 1
-                    else:
-                        # Add subsequent [key, val] pairs to the collection.
-                        temp_data.append({headers[0]:k, headers[1]:v})
-                to_export_data = temp_data
+                items = iter(to_export_data.items())
+                # Use first [key, val] pair as headers.
+                headers = list(next(items))
+                if trim_long_strings:
+                    # Subsequent [key, val] pairs become the collection.
+                    to_export_data = (
+                        {headers[0]:k, headers[1]:v} for k,v in items
+                    )
+                else:
+                    # Subsequent (key, val) pairs are written as they are,
+                    # without building a dict per row.
+                    rows = items
 
     elif isinstance(to_export_data, list):
         if headers is None:
@@ -384,25 +855,259 @@ def export_csv_data_to_disk(filepath, data, delimiter=',',
 
 
     # Export the collection.
+    if rows is None:
+        # CSV limitation, must trim very long strings if asked to.
+        rows = map(make_row_function(headers, trim_long_strings),
+                   to_export_data)
+
     with open(filepath, 'w', encoding='utf-8', errors='replace',
-        newline='') as f:
-        out_writer = csv.DictWriter(f, fieldnames=headers, restval='',
-            extrasaction='ignore', delimiter=delimiter)
-        out_writer.writeheader()
-        for item in to_export_data:
-            if trim_long_strings:
-                for key, val in item.items():
-                # CSV limitation, must trim very long strings.
-                    item[key] = enforce_excel_cell_string_limit(str(val), 32750)
-            out_writer.writerow(item)
+        newline='', buffering=WRITE_BUFFER_SIZE) as f:
+        out_writer = csv.writer(f, delimiter=delimiter)
+        out_writer.writerow(headers)
+        out_writer.writerows(rows)
+
+
+# Export functions by file extension, all called with (filepath, data,
+# delimiter, headers, headers_auto_method, trim_long_strings).
+_EXPORTERS = {
+    '.json': lambda filepath, data, *csv_options:
+        export_json_data_to_disk(filepath, data),
+    '.csv': export_csv_data_to_disk,
+}
+
+
+def export_csv_stream(filepath, records, delimiter=',', headers=None,
+                      trim_long_strings=False):
+    """Writes an iterable of dictionaries to a CSV file as it is consumed.
+
+        Rows are written in chunks of STREAM_CHUNK_SIZE, so 'records' can be a
+        generator reading from another file and only one chunk is held in
+        memory at a time.
+
+        The rows are written to a temporary file next to 'filepath', which
+        replaces it only once all records were written. So 'records' may be
+        read from 'filepath' itself, and if consuming 'records' raises, the
+        temporary file is deleted, the exception is re-raised and any existing
+        file at 'filepath' is left untouched.
+
+        If 'headers' is None, the keys of the first record are used, which
+        is equivalent to the '1st_item' headers_auto_method.
+
+        Parameters
+        ----------
+        filepath : Path
+            Full path to CSV file.
+        records : iterable
+            Iterable of dicts, one per row.
+        delimiter : str, optional
+            Desired delimiter to use for CSV export, by default ','
+        headers : list, optional
+            List containing the fieldnames (column names) for the exported CSV,
+            by default None
+        trim_long_strings : bool, optional
+            If True, will trim strings that exceed Excel cell char limit,
+            by default False"""
+
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        print(
+            "Nothing to export."
+        )
+        return
+
+    if headers is None:
+        # csv.DictReader stores extra fields of a row under the None key.
+        headers = [key for key in first if key is not None]
+
+    parent = filepath.parent
+    if not parent.is_dir():
+        parent.mkdir(parents=True, exist_ok=True)
+    temp_path = filepath.with_name(f'.{filepath.name}.{os.getpid()}.tmp')
+
+    # CSV limitation, must trim very long strings if asked to.
+    rows = map(make_row_function(headers, trim_long_strings),
+               itertools.chain([first], records))
+
+    # Opened before the try block, so that a failure to create the temporary
+    # file is raised as it is, and only a created file is cleaned up.
+    f = open(temp_path, 'w', encoding='utf-8', errors='replace', newline='',
+             buffering=WRITE_BUFFER_SIZE)
+    try:
+        with f:
+            out_writer = csv.writer(f, delimiter=delimiter)
+            out_writer.writerow(headers)
+            while True:
+                chunk = list(itertools.islice(rows, STREAM_CHUNK_SIZE))
+                if not chunk:
+                    break
+                out_writer.writerows(chunk)
+    except BaseException:
+        temp_path.unlink()
+        raise
+
+    os.replace(temp_path, filepath)
+
+
+def json_starts_with_array(filepath):
+    """Checks whether the top-level value of a JSON file is an array.
+
+        Only reads up to the first non-whitespace byte of the file. A file
+        starting with a UTF-8 byte order mark is reported as not an array,
+        since ijson cannot stream it.
+
+        Parameters
+        ----------
+        filepath : Path
+            Full path to JSON file.
+
+        Returns
+        -------
+        bool
+            True if the first non-whitespace character is '['."""
+
+    with open(filepath, 'rb') as f:
+        while True:
+            block = f.read(4096)
+            if not block:
+                return False
+            block = block.lstrip(b' \t\r\n')
+            if block:
+                return block[:1]==b'['
+
+
+def iter_json_array_from_disk(filepath):
+    """Yields the elements of a top-level JSON array one at a time.
+
+        Requires ijson. If the file contains invalid JSON data, or data the
+        ijson backend cannot represent (such as integers wider than 64 bits),
+        ijson.JSONError is raised to the consumer.
+
+        Parameters
+        ----------
+        filepath : Path
+            Full path to JSON file.
+
+        Yields
+        ------
+        dict
+            A single element of the array."""
+
+    with open(filepath, 'rb') as f:
+        yield from ijson.items(f, 'item', use_float=True)
+
+
+def stream_json_array_to_csv(in_path, out_path, headers=None, delimiter=',',
+                             trim_long_strings=False):
+    """Converts a JSON array of objects to CSV without loading it in memory.
+
+        Each element of the top-level array is parsed and written to the CSV
+        one at a time (see export_csv_stream), so memory usage does not grow
+        with the size of the file. Requires ijson.
+
+        If the file contains invalid JSON data, a message is printed and
+        nothing is written. If it contains integers too wide for the ijson
+        backend, nothing is written and False is returned, so that the caller
+        can fall back to loading the whole file.
+
+        Parameters
+        ----------
+        in_path : Path
+            Full path to JSON file.
+        out_path : Path
+            Full path to CSV file.
+        headers : list, optional
+            List containing the fieldnames (column names) for the exported CSV,
+            by default None
+        delimiter : str, optional
+            Desired delimiter to use for CSV export, by default ','
+        trim_long_strings : bool, optional
+            If True, will trim strings that exceed Excel cell char limit,
+            by default False
+
+        Returns
+        -------
+        bool
+            False if the file has to be loaded as a whole, else True."""
+
+    try:
+        export_csv_stream(out_path, iter_json_array_from_disk(in_path),
+                          delimiter, headers, trim_long_strings)
+    except ijson.JSONError as e:
+        # yajl only handles 64-bit integers, valid JSON otherwise.
+        if 'integer overflow' in str(e):
+            return False
+        print(
+            f'{in_path} contains invalid JSON data: {e}'
+        )
+
+    return True
 
 
 def convert_file(import_path, export_path, headers, headers_auto_method,
-                 delimiter, trim_long_string):
+                 delimiter, trim_long_string, import_delimiter=None):
+
+    import_path = Path(import_path)
+    export_path = Path(export_path)
+    import_extension = import_path.suffix.lower()
+    export_extension = export_path.suffix.lower()
+
+    # A single stat of the input serves every branch below.
+    try:
+        import_stat = os.stat(import_path)
+    except (FileNotFoundError, NotADirectoryError):
+        import_stat = None
+    import_is_file = (
+        import_stat is not None and stat.S_ISREG(import_stat.st_mode)
+    )
+
+    # Large JSON arrays going to CSV can be streamed record by record, as
+    # long as the headers do not depend on every record being known in
+    # advance. If the ijson backend cannot represent the data, the file is
+    # loaded as a whole below.
+    if (_IJSON_STREAMING
+            and import_extension=='.json'
+            and export_extension=='.csv'
+            and (headers is not None or headers_auto_method=='1st_item')
+            and import_is_file
+            and import_stat.st_size >= STREAM_MIN_SIZE
+            and json_starts_with_array(import_path)
+            and stream_json_array_to_csv(
+                in_path=import_path,
+                out_path=export_path,
+                headers=headers,
+                delimiter=delimiter,
+                trim_long_strings=trim_long_string
+            )):
+        return
+
+    # CSV to CSV only changes the layout of each row, so rows are streamed
+    # from one file to the other. Booleans are left as strings, so that values
+    # are written back exactly as they were read.
+    if (import_extension=='.csv'
+            and export_extension=='.csv'
+            and import_is_file):
+        try:
+            export_csv_stream(
+                filepath=export_path,
+                records=iter_csv_from_disk(import_path, headers,
+                                           import_delimiter,
+                                           coerce_bools=False),
+                delimiter=delimiter,
+                headers=headers,
+                trim_long_strings=trim_long_string
+            )
+        except (csv.Error, UnicodeDecodeError) as e:
+            print(
+                f'{import_path} exists, but could not load it: {e}'
+            )
+        return
 
     imported_data = import_data_from_disk(
         filepath=import_path,
-        headers=headers
+        headers=headers,
+        delimiter=import_delimiter,
+        file_stat=import_stat
     )
 
     export_data_to_disk(
@@ -415,6 +1120,59 @@ def convert_file(import_path, export_path, headers, headers_auto_method,
     )
 
 
+def convert_files(path_pairs, headers=None, headers_auto_method='1st_item',
+                  delimiter=',', trim_long_string=False, import_delimiter=None,
+                  max_workers=None):
+    """Converts many files in parallel, using a pool of processes.
+
+        Each worker runs convert_file end to end (import and export) on its
+        files, so the imported data never has to be sent between processes.
+        The remaining parameters are the same as in convert_file and apply to
+        every file. Pairs whose export file is not a '.json' or '.csv' are
+        skipped with a message, rather than stopping the whole batch.
+
+        Parameters
+        ----------
+        path_pairs : list
+            List of (import_path, export_path) tuples.
+        max_workers : int, optional
+            Number of worker processes. If None, the number of CPUs is used,
+            by default None"""
+
+    supported_pairs = []
+    for import_path, export_path in path_pairs:
+        if Path(export_path).suffix.lower() in _EXPORTERS:
+            supported_pairs.append((import_path, export_path))
+        else:
+            print(
+                f"Skipping {export_path}: exports can only be made to .json "
+                "and .csv formats."
+            )
+
+    path_pairs = supported_pairs
+    if not path_pairs:
+        return
+
+    import_paths, export_paths = zip(*path_pairs)
+    convert = functools.partial(
+        convert_file,
+        headers=headers,
+        headers_auto_method=headers_auto_method,
+        delimiter=delimiter,
+        trim_long_string=trim_long_string,
+        import_delimiter=import_delimiter
+    )
+
+    workers = max_workers or os.cpu_count() or 1
+    # A few chunks per worker keeps the load balanced with little overhead.
+    chunksize = max(1, len(path_pairs) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Consume the results so that exceptions raised in workers surface.
+        list(executor.map(convert, import_paths, export_paths,
+                          chunksize=chunksize))
+
+
 def main():
     # SET THESE
     # import_path: full path to file to import, including file extension.
@@ -456,6 +1214,11 @@ def main():
     # default ','.
     delimiter = ','
 
+    # import_delimiter: The delimiter used in the imported file, WHEN THE
+    # IMPORTED FILE IS A CSV. If left to 'None', it is detected from the file,
+    # which can be slow, so set it when it is known, by default 'None'.
+    import_delimiter = None
+
     # Trim strings that exceed Excel cell char limit. Only pertinent for CSV
     # CSV exports, by default False.
     trim_long_string=False
@@ -467,7 +1230,8 @@ def main():
         headers=headers,
         headers_auto_method=headers_auto_method,
         delimiter=delimiter,
-        trim_long_string=trim_long_string
+        trim_long_string=trim_long_string,
+        import_delimiter=import_delimiter
     )
 
 